@@ -8,10 +8,14 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     API_DEBUG: bool = True
     
+    # Browser fallback settings ("playwright" or "selenium")
+    BROWSER_BACKEND: str = "playwright"
+    
     # Selenium settings
     HEADLESS: bool = True
     IMPLICIT_WAIT: int = 10
     PAGE_LOAD_TIMEOUT: int = 30
+    DRIVER_IDLE_TTL: int = 300
     
     # Ozon settings
     OZON_BASE_URL: str = "https://www.ozon.ru"
@@ -21,7 +25,14 @@ class Settings(BaseSettings):
     # Parser settings
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 2
+    RETRY_MAX_DELAY: int = 30
     REQUEST_TIMEOUT: int = 10
+    HTTP_KEEPALIVE_TIMEOUT: int = 60
+    MAX_CONCURRENT_REQUESTS: int = 50
+    
+    # Cache settings
+    PRICE_CACHE_TTL: int = 300
+    PRICE_CACHE_MAXSIZE: int = 100000
     
     # Worker settings
     MAX_ARTICLES_PER_WORKER: int = 10
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import threading
+import aiohttp
+from config.settings import settings
+from utils.helpers import build_ozon_api_headers
+from typing import Any, Coroutine, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpManager:
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.closing = False
+        self.lock = threading.Lock()
+    
+    def setup_session(self) -> aiohttp.ClientSession:
+        """
+        Start a background event loop with a keep-alive session shared by all requests;
+        the loop also hosts the Playwright fallback
+        """
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="http-manager", daemon=True)
+        self.thread.start()
+        
+        self.session = self.run(self._create_session())
+        logger.info("HTTP session setup successfully")
+        return self.session
+    
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create session with a pooled connector (must run on the manager loop)
+        """
+        self.semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+        
+        connector = aiohttp.TCPConnector(
+            limit=settings.MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300
+        )
+        
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.REQUEST_TIMEOUT),
+            headers=build_ozon_api_headers()
+        )
+    
+    def run(self, coro: Coroutine) -> Any:
+        """
+        Run coroutine on the manager loop and wait for its result
+        """
+        with self.lock:
+            if not self.loop or self.closing:
+                coro.close()
+                raise RuntimeError("HTTP manager not running")
+            
+            future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        
+        return future.result()
+    
+    async def _shutdown(self):
+        """
+        Cancel in-flight work so threads waiting in run() are released, then close session
+        """
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self.session:
+            await self.session.close()
+    
+    def close(self):
+        """
+        Close session and stop the background loop
+        """
+        with self.lock:
+            if not self.loop or self.closing:
+                return
+            # No new coroutines from here on, so nothing can be left waiting on a stopped loop
+            self.closing = True
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+            logger.info("HTTP session closed successfully")
+        except Exception as e:
+            logger.error("Error closing HTTP session: %s", e)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.loop = None
+            self.thread = None
+            self.session = None
+            self.semaphore = None
+            self.closing = False
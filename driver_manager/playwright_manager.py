@@ -0,0 +1,98 @@
+import logging
+from playwright.async_api import async_playwright, Browser, Playwright, Response
+from config.settings import settings
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlaywrightManager:
+    def __init__(self):
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+    
+    async def setup_browser(self) -> Browser:
+        """
+        Launch a single Chromium instance shared by all pages
+        """
+        try:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=settings.HEADLESS,
+                args=[
+                    "--no-sandbox",
+                    "--disable-dev-shm-usage",
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-extensions",
+                ]
+            )
+            
+            logger.info("Playwright browser setup successfully")
+            return self.browser
+            
+        except Exception as e:
+            logger.error("Failed to setup Playwright browser: %s", e)
+            await self.close()
+            raise
+    
+    def is_connected(self) -> bool:
+        """
+        Check browser is running and connected
+        """
+        return self.browser is not None and self.browser.is_connected()
+    
+    async def fetch_json(self, url: str) -> Optional[bytes]:
+        """
+        Open URL in an isolated context and return the composer JSON body
+        """
+        if not self.browser:
+            logger.error("Browser not initialized")
+            return None
+        
+        context = await self.browser.new_context(
+            user_agent=settings.USER_AGENT,
+            locale="ru-RU",
+            viewport={"width": 1920, "height": 1080}
+        )
+        
+        try:
+            page = await context.new_page()
+            
+            # Anti-bot challenge pages reload into the API response, so wait
+            # for the JSON response itself rather than the first navigation
+            async with page.expect_response(
+                self._is_json_response,
+                timeout=settings.PAGE_LOAD_TIMEOUT * 1000
+            ) as response_info:
+                await page.goto(url, timeout=settings.PAGE_LOAD_TIMEOUT * 1000)
+            
+            response = await response_info.value
+            return await response.body()
+            
+        finally:
+            await context.close()
+    
+    @staticmethod
+    def _is_json_response(response: Response) -> bool:
+        """
+        Match successful composer API responses
+        """
+        content_type = response.headers.get("content-type", "")
+        return "composer-api.bx" in response.url and response.ok and "json" in content_type
+    
+    async def close(self):
+        """
+        Close browser and stop Playwright
+        """
+        try:
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+            logger.info("Playwright browser closed successfully")
+        except Exception as e:
+            logger.error("Error closing Playwright browser: %s", e)
+        finally:
+            self.browser = None
+            self.playwright = None
@@ -1,4 +1,8 @@
+import base64
 import logging
+import queue
+import threading
+from multiprocessing import util as mp_util
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -8,13 +12,136 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium_stealth import stealth
 from config.settings import settings
-from typing import Optional
+from utils.helpers import is_blocked_content
+from typing import List, Optional, Set
 import time
 import json
+import orjson
 
 
 logger = logging.getLogger(__name__)
 
+# Substring identifying the Ozon composer API request among page network traffic
+COMPOSER_API_MARKER = "composer-api.bx"
+
+# Idle drivers of this process as (driver, released_at), reused across batches
+_DRIVER_POOL: queue.LifoQueue = queue.LifoQueue(maxsize=settings.MAX_WORKERS)
+
+# Guards eviction against concurrent acquire/release emptying or filling the pool
+_pool_lock = threading.Lock()
+
+# Background eviction so idle drivers are freed even when no more batches arrive
+_eviction_timer: Optional[threading.Timer] = None
+_eviction_lock = threading.Lock()
+
+
+def _is_driver_alive(driver: webdriver.Chrome) -> bool:
+    """
+    Check driver still responds to commands
+    """
+    try:
+        return driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+
+def _quit_driver(driver: webdriver.Chrome):
+    """
+    Quit driver ignoring errors
+    """
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.error("Error closing driver: %s", e)
+
+
+def _take_stale_drivers() -> List[webdriver.Chrome]:
+    """
+    Remove drivers idle for longer than DRIVER_IDLE_TTL from the pool (caller holds _pool_lock and quits them)
+    """
+    now = time.monotonic()
+    fresh = []
+    stale = []
+    
+    while True:
+        try:
+            driver, released_at = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        
+        if now - released_at > settings.DRIVER_IDLE_TTL:
+            stale.append(driver)
+        else:
+            fresh.append((driver, released_at))
+    
+    # Oldest first so the most recently used driver stays on top of the LIFO
+    for item in reversed(fresh):
+        try:
+            _DRIVER_POOL.put_nowait(item)
+        except queue.Full:
+            stale.append(item[0])
+    
+    return stale
+
+
+def _evict_idle_drivers():
+    """
+    Quit pooled drivers idle for longer than DRIVER_IDLE_TTL
+    """
+    with _pool_lock:
+        stale = _take_stale_drivers()
+    
+    for driver in stale:
+        _quit_driver(driver)
+
+
+def _schedule_eviction():
+    """
+    Start the eviction timer unless one is already pending
+    """
+    global _eviction_timer
+    
+    with _eviction_lock:
+        if _eviction_timer is not None:
+            return
+        
+        _eviction_timer = threading.Timer(settings.DRIVER_IDLE_TTL, _run_scheduled_eviction)
+        _eviction_timer.daemon = True
+        _eviction_timer.start()
+
+
+def _run_scheduled_eviction():
+    """
+    Evict idle drivers and keep the timer going while the pool is not empty
+    """
+    global _eviction_timer
+    
+    try:
+        _evict_idle_drivers()
+    finally:
+        with _eviction_lock:
+            _eviction_timer = None
+    
+    if not _DRIVER_POOL.empty():
+        _schedule_eviction()
+
+
+def close_pooled_drivers():
+    """
+    Quit every idle driver of this process
+    """
+    while True:
+        with _pool_lock:
+            try:
+                driver, _ = _DRIVER_POOL.get_nowait()
+            except queue.Empty:
+                return
+        _quit_driver(driver)
+
+
+# Worker processes exit without running atexit hooks, multiprocessing finalizers do run
+mp_util.Finalize(None, close_pooled_drivers, exitpriority=10)
+
 
 class SeleniumManager:
     def __init__(self):
@@ -49,6 +176,9 @@ class SeleniumManager:
         # Window size
         chrome_options.add_argument("--window-size=1920,1080")
         
+        # Network events are read from the performance log instead of polling page_source
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
         try:
             driver = webdriver.Chrome(options=chrome_options)
             
@@ -69,6 +199,9 @@ class SeleniumManager:
             # Execute script to hide automation
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            # Network domain is needed for Network.getResponseBody
+            driver.execute_cdp_cmd("Network.enable", {})
+            
             self.driver = driver
             self.wait = WebDriverWait(driver, settings.IMPLICIT_WAIT)
             
@@ -76,9 +209,69 @@ class SeleniumManager:
             return driver
             
         except WebDriverException as e:
-            logger.error(f"Failed to setup Chrome driver: {e}")
+            logger.error("Failed to setup Chrome driver: %s", e)
             raise
     
+    def acquire_driver(self) -> webdriver.Chrome:
+        """
+        Reuse a healthy pooled driver or setup a new one
+        """
+        while True:
+            with _pool_lock:
+                stale = _take_stale_drivers()
+                try:
+                    driver, _ = _DRIVER_POOL.get_nowait()
+                except queue.Empty:
+                    driver = None
+            
+            for stale_driver in stale:
+                _quit_driver(stale_driver)
+            
+            if driver is None:
+                return self.setup_driver()
+            
+            if _is_driver_alive(driver):
+                self.driver = driver
+                self.wait = WebDriverWait(driver, settings.IMPLICIT_WAIT)
+                logger.info("Reusing pooled Chrome driver")
+                return driver
+            
+            _quit_driver(driver)
+    
+    def release_driver(self):
+        """
+        Return driver to the pool if it is still healthy, otherwise quit it
+        """
+        if not self.driver:
+            return
+        
+        driver = self.driver
+        self.driver = None
+        self.wait = None
+        
+        alive = _is_driver_alive(driver)
+        pooled = False
+        
+        with _pool_lock:
+            stale = _take_stale_drivers()
+            if alive:
+                try:
+                    _DRIVER_POOL.put_nowait((driver, time.monotonic()))
+                    pooled = True
+                except queue.Full:
+                    pass
+        
+        for stale_driver in stale:
+            _quit_driver(stale_driver)
+        
+        if pooled:
+            _schedule_eviction()
+            logger.info("Driver returned to pool")
+            return
+        
+        _quit_driver(driver)
+        logger.info("Driver closed successfully")
+    
     def navigate_to_url(self, url: str) -> bool:
         """
         Navigate to URL with error handling
@@ -88,7 +281,10 @@ class SeleniumManager:
             return False
         
         try:
-            logger.info(f"Navigating to: {url}")
+            # Drop network events of previous pages so they can't be mistaken for this one
+            self.driver.get_log("performance")
+            
+            logger.info("Navigating to: %s", url)
             self.driver.get(url)
             
             # Wait a bit for page to load
@@ -102,10 +298,10 @@ class SeleniumManager:
             return True
             
         except TimeoutException:
-            logger.error(f"Timeout while loading: {url}")
+            logger.error("Timeout while loading: %s", url)
             return False
         except WebDriverException as e:
-            logger.error(f"WebDriver error: {e}")
+            logger.error("WebDriver error: %s", e)
             return False
     
     def is_blocked(self) -> bool:
@@ -116,83 +312,68 @@ class SeleniumManager:
             return True
             
         try:
-            # Common anti-bot indicators
-            blocked_indicators = [
-                "cloudflare",
-                "checking your browser",
-                "enable javascript",
-                "access denied",
-                "blocked"
-            ]
-            
-            page_source = self.driver.page_source.lower()
-            
-            for indicator in blocked_indicators:
-                if indicator in page_source:
-                    return True
-                    
-            return False
+            return is_blocked_content(self.driver.page_source)
             
         except Exception:
             return True
     
     def wait_for_json_response(self, timeout: int = 30) -> Optional[str]:
         """
-        Wait for JSON response with improved logic
+        Wait for the composer API response captured from CDP network events
         """
         if not self.driver:
             return None
             
         try:
             logger.info("Waiting for JSON response...")
-            start_time = time.time()
-            
-            # Сначала ждем загрузки страницы
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
             
-            # Теперь ждем появления JSON данных
-            while time.time() - start_time < timeout:
-                try:
-                    page_source = self.driver.page_source
-                    
-                    # Извлекаем JSON из HTML обертки
-                    json_content = self.extract_json_from_html(page_source)
-                    
-                    if json_content:
-                        try:
-                            # Проверяем, что JSON валидный
-                            data = json.loads(json_content)
-                            
-                            # Проверяем наличие widgetStates
-                            if 'widgetStates' in data:
-                                logger.info("JSON response with widgetStates found")
-                                return json_content
-                            
-                        except json.JSONDecodeError:
-                            # Это не валидный JSON, продолжаем ждать
-                            pass
-                    
-                    # Логируем первые несколько попыток для отладки
-                    if time.time() - start_time < 5:
-                        logger.debug(f"Page content preview: {page_source[:200]}...")
-                    
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.debug(f"Error checking page source: {e}")
-                    time.sleep(0.5)
-                    continue
+            json_content = self._wait_for_composer_response(timeout)
+            if json_content:
+                logger.info("JSON response captured from network")
+                return json_content
             
-            logger.warning(f"Timeout waiting for JSON response after {timeout} seconds")
-            # Возвращаем последний извлеченный JSON для отладки
+            logger.warning("Timeout waiting for JSON response after %s seconds", timeout)
+            # Возвращаем то, что сейчас на странице, для отладки
             return self.extract_json_from_html(self.driver.page_source)
             
         except Exception as e:
-            logger.error(f"Error waiting for JSON response: {e}")
+            logger.error("Error waiting for JSON response: %s", e)
             return None
     
+    def _wait_for_composer_response(self, timeout: int) -> Optional[str]:
+        """
+        Read performance log until the composer API request finishes loading, then fetch its body
+        """
+        deadline = time.monotonic() + timeout
+        request_ids: Set[str] = set()
+        
+        while time.monotonic() < deadline:
+            for entry in self.driver.get_log("performance"):
+                message = orjson.loads(entry["message"])["message"]
+                method = message.get("method")
+                params = message.get("params", {})
+                
+                if method == "Network.responseReceived":
+                    response = params.get("response", {})
+                    if (COMPOSER_API_MARKER in response.get("url", "")
+                            and response.get("status") == 200
+                            and "json" in response.get("mimeType", "")):
+                        request_ids.add(params["requestId"])
+                
+                elif method == "Network.loadingFinished" and params.get("requestId") in request_ids:
+                    result = self.driver.execute_cdp_cmd(
+                        "Network.getResponseBody",
+                        {"requestId": params["requestId"]}
+                    )
+                    if result.get("base64Encoded"):
+                        return base64.b64decode(result["body"]).decode()
+                    return result["body"]
+            
+            # Events are already buffered by the browser, this only bounds the log reads
+            time.sleep(0.05)
+        
+        return None
+    
     def extract_json_from_html(self, html_content: str) -> Optional[str]:
         """
         Extract JSON from HTML wrapper (from <pre> tag)
@@ -224,69 +405,55 @@ class SeleniumManager:
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting JSON from HTML: {e}")
+            logger.error("Error extracting JSON from HTML: %s", e)
             return None
 
     def debug_page_content(self):
         """
-        Debug helper to see what's on the page
+        Debug helper to see what's on the page, skipped unless DEBUG logging is enabled
         """
-        if not self.driver:
+        if not self.driver or not logger.isEnabledFor(logging.DEBUG):
             return
             
         try:
             content = self.driver.page_source
-            logger.info(f"Page content length: {len(content)}")
-            logger.info(f"Content starts with: {content[:200]}")
+            logger.debug("Page content length: %s", len(content))
+            logger.debug("Content starts with: %s", content[:200])
             
             # Проверяем наличие <pre> тега
             if '<pre' in content.lower():
-                logger.info("Page contains <pre> tag")
+                logger.debug("Page contains <pre> tag")
                 
                 # Попробуем извлечь JSON
                 json_content = self.extract_json_from_html(content)
                 if json_content:
-                    logger.info(f"Extracted JSON length: {len(json_content)}")
-                    logger.info(f"JSON starts with: {json_content[:100]}")
+                    logger.debug("Extracted JSON length: %s", len(json_content))
+                    logger.debug("JSON starts with: %s", json_content[:100])
                     
                     try:
                         data = json.loads(json_content)
                         if 'widgetStates' in data:
-                            logger.info("Extracted JSON contains widgetStates")
+                            logger.debug("Extracted JSON contains widgetStates")
                             widget_states = data['widgetStates']
-                            logger.info(f"WidgetStates keys count: {len(widget_states)}")
+                            logger.debug("WidgetStates keys count: %s", len(widget_states))
                         else:
-                            logger.info("Extracted JSON does not contain widgetStates")
-                            logger.info(f"JSON keys: {list(data.keys())}")
+                            logger.debug("Extracted JSON does not contain widgetStates")
+                            logger.debug("JSON keys: %s", list(data.keys()))
                     except json.JSONDecodeError as e:
-                        logger.info(f"Extracted content is not valid JSON: {e}")
+                        logger.debug("Extracted content is not valid JSON: %s", e)
                 else:
-                    logger.info("Could not extract JSON from <pre> tag")
+                    logger.debug("Could not extract JSON from <pre> tag")
             
             # Проверяем наличие JavaScript
             if 'script' in content.lower():
-                logger.info("Page contains JavaScript")
+                logger.debug("Page contains JavaScript")
             
             # Проверяем, есть ли уже JSON напрямую
             stripped_content = content.strip()
             if stripped_content.startswith('{'):
-                logger.info("Page contains direct JSON structure")
+                logger.debug("Page contains direct JSON structure")
             else:
-                logger.info("Page contains HTML wrapper")
+                logger.debug("Page contains HTML wrapper")
                 
         except Exception as e:
-            logger.error(f"Error in debug: {e}")
-    
-    def close(self):
-        """
-        Close driver and cleanup
-        """
-        if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("Driver closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing driver: {e}")
-            finally:
-                self.driver = None
-                self.wait = None
\ No newline at end of file
+            logger.error("Error in debug: %s", e)
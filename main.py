@@ -1,6 +1,7 @@
 import logging
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from routes.parser_routes import router as parser_router
@@ -87,7 +88,7 @@ async def shutdown_event():
     # Clean up parser instance
     from routes.parser_routes import parser_instance
     if parser_instance:
-        parser_instance.close()
+        await run_in_threadpool(parser_instance.close)
 
 
 if __name__ == "__main__":
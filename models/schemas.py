@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 from config.settings import settings
 
 
 class ArticlesRequest(BaseModel):
-    articles: List[int] = Field(..., min_items=1, max_items=settings.MAX_ARTICLES_PER_REQUEST)
+    articles: List[int] = Field(..., min_length=1, max_length=settings.MAX_ARTICLES_PER_REQUEST)
     
-    @validator('articles')
+    @field_validator('articles')
+    @classmethod
     def validate_articles(cls, v):
         if not v:
             raise ValueError('Articles list cannot be empty')
@@ -26,6 +27,15 @@ class ArticleResult(BaseModel):
     success: bool
     price_info: Optional[PriceInfo] = None
     error: Optional[str] = None
+    
+    # Results are built from already typed parser values, so skip re-validation
+    @classmethod
+    def ok(cls, article: int, price_info: PriceInfo) -> "ArticleResult":
+        return cls.model_construct(article=article, success=True, price_info=price_info)
+    
+    @classmethod
+    def fail(cls, article: int, error: str) -> "ArticleResult":
+        return cls.model_construct(article=article, success=False, error=error)
 
 
 class ParseResponse(BaseModel):
@@ -1,113 +1,410 @@
-import json
+import asyncio
 import logging
 import time
 import concurrent.futures
-from typing import List, Optional
-from driver_manager.selenium_manager import SeleniumManager
+import multiprocessing
+import queue
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from concurrent.futures.process import BrokenProcessPool
+from driver_manager.selenium_manager import SeleniumManager, close_pooled_drivers
+from driver_manager.playwright_manager import PlaywrightManager
+from driver_manager.http_manager import HttpManager
 from models.schemas import ArticleResult, PriceInfo
 from utils.helpers import (
     build_ozon_api_url, 
-    find_web_price_property, 
-    find_product_title,
-    parse_price_data,
-    is_valid_json_response
+    is_blocked_content,
+    find_price_and_title,
+    scan_price_and_title,
+    get_retry_delay,
+    parse_price_data
 )
 from config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+# Statuses Ozon answers with when a request is challenged
+BLOCKED_STATUS_CODES = {403}
+
+# Statuses worth retrying over plain HTTP before falling back to the browser
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+async def _fetch_article(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, article: int) -> Optional[bytes]:
+    """
+    Fetch composer JSON for article directly, None if browser fallback is needed
+    """
+    url = build_ozon_api_url(article)
+    
+    for attempt in range(settings.MAX_RETRIES):
+        retry_after = None
+        
+        try:
+            # Only the request itself holds a slot, backoff sleeps do not
+            async with semaphore, session.get(url) as response:
+                body = await response.read()
+                
+                if response.status in BLOCKED_STATUS_CODES:
+                    logger.warning("Article %s blocked with HTTP %s", article, response.status)
+                    return None
+                
+                if response.status in RETRY_STATUS_CODES:
+                    logger.warning("Article %s got HTTP %s", article, response.status)
+                    retry_after = response.headers.get('Retry-After')
+                elif not body.lstrip().startswith(b'{'):
+                    # Composer only answers with JSON, anything else goes to the browser
+                    if is_blocked_content(body.decode(errors='ignore')):
+                        logger.warning("Article %s got anti-bot challenge", article)
+                    else:
+                        logger.warning("Article %s got non-JSON response with HTTP %s", article, response.status)
+                    return None
+                else:
+                    return body
+                
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("HTTP request failed for article %s: %r", article, e)
+        
+        if attempt < settings.MAX_RETRIES - 1:
+            delay = get_retry_delay(attempt, retry_after)
+            logger.info("Retrying article %s over HTTP in %.1f seconds...", article, delay)
+            await asyncio.sleep(delay)
+    
+    return None
+
+
+async def _parse_article_http(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, article: int) -> Optional[ArticleResult]:
+    """
+    Fetch and parse article as soon as its response arrives, None if browser fallback is needed
+    """
+    body = await _fetch_article(session, semaphore, article)
+    
+    if body is None:
+        return None
+    
+    price_info = OzonWorker.extract_price_info(body)
+    
+    if price_info:
+        return ArticleResult.ok(article, price_info)
+    
+    return ArticleResult.fail(article, "Failed to extract price info")
+
+
+async def _parse_articles_http(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, articles: List[int]) -> List[Optional[ArticleResult]]:
+    """
+    Parse all articles concurrently over one shared session
+    """
+    return await asyncio.gather(*[_parse_article_http(session, semaphore, article) for article in articles])
+
+
+def _parse_worker_queue(tasks_queue: queue.Queue, results_queue: queue.Queue):
+    """
+    Take (index, article) tasks from the shared queue until it is empty,
+    pushing each (index, result) as soon as it is ready
+    """
+    worker = OzonWorker()
+    try:
+        worker.initialize()
+        while True:
+            try:
+                index, article = tasks_queue.get_nowait()
+            except queue.Empty:
+                break
+            results_queue.put((index, worker.parse_single_article(article)))
+    except Exception as e:
+        # Articles left in the queue are picked up by the other workers
+        logger.error("Worker failed: %s", e)
+    finally:
+        worker.close()
+
 
 class OzonParser:
     def __init__(self):
         self.workers = []
+        self.http_manager = HttpManager()
+        self.cache = TTLCache(maxsize=settings.PRICE_CACHE_MAXSIZE, ttl=settings.PRICE_CACHE_TTL)
+        self.cache_lock = threading.Lock()
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.manager = None
+        self.executor_lock = threading.Lock()
+        self.playwright_worker: Optional[OzonPlaywrightWorker] = None
+        self.playwright_lock = asyncio.Lock()
     
     def initialize(self):
         """
         Initialize parser - workers will be created on demand
         """
+        self.http_manager.setup_session()
         logger.info("Ozon parser initialized successfully")
     
     def parse_articles(self, articles: List[int]) -> List[ArticleResult]:
         """
-        Parse multiple articles using parallel workers
+        Parse multiple articles via direct API requests, falling back to browser workers
         """
-        worker_groups = self._distribute_articles(articles)
+        unique_articles = list(dict.fromkeys(articles))
+        results: List[Optional[ArticleResult]] = [None] * len(unique_articles)
         
-        if len(worker_groups) == 1:
-            return self._parse_with_single_worker(articles)
+        pending_tasks = self._fill_cached_results(unique_articles, results)
         
-        return self._parse_with_multiple_workers(worker_groups, articles)
+        if pending_tasks:
+            fallback_tasks = self._parse_with_http(pending_tasks, results)
+            
+            if fallback_tasks:
+                logger.info("Falling back to browser for %s articles", len(fallback_tasks))
+                for index, result in self._parse_with_browser(fallback_tasks):
+                    results[index] = result
+            
+            self._cache_results(results[index] for index, _ in pending_tasks)
+        
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = ArticleResult.fail(unique_articles[index], "Article was not processed")
+        
+        if len(unique_articles) == len(articles):
+            return results
+        
+        # Expand duplicates back to the requested order
+        index_of = {article: index for index, article in enumerate(unique_articles)}
+        return [results[index_of[article]] for article in articles]
     
-    def _distribute_articles(self, articles: List[int]) -> List[List[int]]:
+    def _fill_cached_results(self, articles: List[int], results: List[Optional[ArticleResult]]) -> List[Tuple[int, int]]:
         """
-        Distribute articles across workers
+        Put cached results in place, return (index, article) tasks that still need parsing
         """
-        total = len(articles)
+        pending_tasks = []
         
-        if total <= settings.MAX_ARTICLES_PER_WORKER:
-            return [articles]
+        with self.cache_lock:
+            for index, article in enumerate(articles):
+                cached = self.cache.get(article)
+                if cached:
+                    results[index] = cached
+                else:
+                    pending_tasks.append((index, article))
         
-        groups = []
-        for i in range(0, total, settings.MAX_ARTICLES_PER_WORKER):
-            group = articles[i:i + settings.MAX_ARTICLES_PER_WORKER]
-            groups.append(group)
-            if len(groups) >= settings.MAX_WORKERS:
-                break
+        cached_count = len(articles) - len(pending_tasks)
+        if cached_count:
+            logger.info("Cache hit for %s of %s articles", cached_count, len(articles))
         
-        return groups
+        return pending_tasks
     
-    def _parse_with_single_worker(self, articles: List[int]) -> List[ArticleResult]:
+    def _cache_results(self, results: Iterable[Optional[ArticleResult]]):
         """
-        Parse with single worker
+        Cache successful results, failures are always retried
         """
-        worker = OzonWorker()
-        try:
-            worker.initialize()
-            return worker.parse_articles(articles)
-        finally:
-            worker.close()
+        with self.cache_lock:
+            for result in results:
+                if result and result.success:
+                    self.cache[result.article] = result
     
-    def _parse_with_multiple_workers(self, worker_groups: List[List[int]], original_articles: List[int]) -> List[ArticleResult]:
+    def _parse_with_http(self, tasks: List[Tuple[int, int]], results: List[Optional[ArticleResult]]) -> List[Tuple[int, int]]:
         """
-        Parse using multiple workers in parallel
+        Fetch and parse articles concurrently without a browser, return tasks needing the browser
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(worker_groups)) as executor:
-            futures = []
+        articles = [article for _, article in tasks]
+        parsed_results = self.http_manager.run(_parse_articles_http(
+            self.http_manager.session,
+            self.http_manager.semaphore,
+            articles
+        ))
+        
+        fallback_tasks = []
+        for (index, article), result in zip(tasks, parsed_results):
+            if result is None:
+                fallback_tasks.append((index, article))
+            else:
+                results[index] = result
+        
+        return fallback_tasks
+    
+    def _parse_with_browser(self, tasks: List[Tuple[int, int]]) -> Iterator[Tuple[int, ArticleResult]]:
+        """
+        Parse articles using parallel browser workers, yielding (index, result) as they arrive
+        """
+        if settings.BROWSER_BACKEND == "playwright":
+            articles = [article for _, article in tasks]
+            browser_results = self.http_manager.run(self._parse_with_playwright(articles))
+            yield from zip((index for index, _ in tasks), browser_results)
+            return
+        
+        workers_count = self._count_workers(tasks)
+        
+        if workers_count == 1:
+            yield from self._parse_with_single_worker(tasks)
+        else:
+            yield from self._parse_with_multiple_workers(tasks, workers_count)
+    
+    async def _parse_with_playwright(self, articles: List[int]) -> List[ArticleResult]:
+        """
+        Parse articles as concurrent pages of the shared Playwright browser (runs on the HTTP manager loop)
+        """
+        async with self.playwright_lock:
+            if self.playwright_worker is None or not self.playwright_worker.is_alive():
+                if self.playwright_worker:
+                    await self.playwright_worker.close()
+                    self.playwright_worker = None
+                
+                worker = OzonPlaywrightWorker()
+                try:
+                    await worker.initialize()
+                except Exception as e:
+                    # Keep the HTTP results, only the fallback articles fail
+                    return [ArticleResult.fail(article, f"No browser worker available: {e}") for article in articles]
+                self.playwright_worker = worker
+        
+        return await self.playwright_worker.parse_articles(articles)
+    
+    def _count_workers(self, tasks: List[Tuple[int, int]]) -> int:
+        """
+        Number of workers needed, each taking roughly MAX_ARTICLES_PER_WORKER articles
+        """
+        needed = -(-len(tasks) // settings.MAX_ARTICLES_PER_WORKER)
+        return max(1, min(settings.MAX_WORKERS, needed))
+    
+    def _parse_with_single_worker(self, tasks: List[Tuple[int, int]]) -> Iterator[Tuple[int, ArticleResult]]:
+        """
+        Parse with single worker in the current process
+        """
+        tasks_queue = queue.Queue()
+        results_queue = queue.Queue()
+        for task in tasks:
+            tasks_queue.put(task)
+        
+        _parse_worker_queue(tasks_queue, results_queue)
+        
+        while not results_queue.empty():
+            yield results_queue.get()
+        
+        yield from self._drain_unparsed(tasks_queue)
+    
+    def _parse_with_multiple_workers(self, tasks: List[Tuple[int, int]], workers_count: int) -> Iterator[Tuple[int, ArticleResult]]:
+        """
+        Parse using multiple workers in parallel; workers pull articles from a
+        shared queue, so a fast worker keeps taking work instead of idling
+        """
+        total = len(tasks)
+        
+        try:
+            executor, tasks_queue, results_queue, futures = self._submit_workers(tasks, workers_count)
+        except BrokenProcessPool:
+            # A worker process died during an earlier batch, start a fresh pool once
+            logger.warning("Worker process pool is broken, restarting it")
+            self._reset_executor(self.executor)
+            executor, tasks_queue, results_queue, futures = self._submit_workers(tasks, workers_count)
+        
+        completed = 0
+        while completed < total:
+            # Check before waiting: if every worker had already exited, an empty queue is final
+            workers_done = all(future.done() for future in futures)
+            try:
+                indexed_result = results_queue.get(timeout=1)
+            except queue.Empty:
+                if workers_done:
+                    break
+                continue
+            
+            completed += 1
+            yield indexed_result
+        
+        yield from self._drain_unparsed(tasks_queue)
+        
+        for future in futures:
+            if not future.done():
+                continue
             
-            for group in worker_groups:
-                future = executor.submit(self._parse_worker_group, group)
-                futures.append(future)
+            error = future.exception()
+            if error is None:
+                continue
             
-            all_results = []
-            for future in concurrent.futures.as_completed(futures):
-                worker_results = future.result()
-                all_results.extend(worker_results)
+            logger.error("Browser worker failed: %r", error)
+            if isinstance(error, BrokenProcessPool):
+                self._reset_executor(executor)
+    
+    def _submit_workers(self, tasks: List[Tuple[int, int]], workers_count: int):
+        """
+        Queue tasks and start workers_count workers on the process pool
+        """
+        executor, manager = self._get_executor()
         
-        return self._sort_results_by_original_order(all_results, original_articles)
+        tasks_queue = manager.Queue()
+        results_queue = manager.Queue()
+        for task in tasks:
+            tasks_queue.put(task)
+        
+        futures = [
+            executor.submit(_parse_worker_queue, tasks_queue, results_queue)
+            for _ in range(workers_count)
+        ]
+        
+        return executor, tasks_queue, results_queue, futures
     
-    def _parse_worker_group(self, articles: List[int]) -> List[ArticleResult]:
+    def _reset_executor(self, broken_executor: Optional[concurrent.futures.ProcessPoolExecutor]):
         """
-        Parse articles with dedicated worker
+        Drop a broken process pool so the next batch starts a new one;
+        a pool already replaced by another request is left alone
         """
-        worker = OzonWorker()
-        try:
-            worker.initialize()
-            return worker.parse_articles(articles)
-        finally:
-            worker.close()
+        with self.executor_lock:
+            if self.executor is None or self.executor is not broken_executor:
+                return
+            
+            try:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.manager.shutdown()
+            except Exception as e:
+                logger.error("Error shutting down broken worker pool: %s", e)
+            finally:
+                self.executor = None
+                self.manager = None
     
-    def _sort_results_by_original_order(self, results: List[ArticleResult], original_articles: List[int]) -> List[ArticleResult]:
+    def _get_executor(self):
         """
-        Sort results to match original article order
+        Lazily start worker processes; they live as long as the parser so
+        their pooled drivers survive between batches
         """
-        result_dict = {result.article: result for result in results}
-        return [result_dict[article] for article in original_articles if article in result_dict]
+        with self.executor_lock:
+            if self.executor is None:
+                mp_context = multiprocessing.get_context("spawn")
+                self.manager = mp_context.Manager()
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=settings.MAX_WORKERS,
+                    mp_context=mp_context
+                )
+                logger.info("Worker process pool created with up to %s processes", settings.MAX_WORKERS)
+            
+            return self.executor, self.manager
+    
+    def _drain_unparsed(self, tasks_queue: queue.Queue) -> Iterator[Tuple[int, ArticleResult]]:
+        """
+        Report articles no worker was able to take (e.g. every driver failed to start)
+        """
+        while True:
+            try:
+                index, article = tasks_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            yield index, ArticleResult.fail(article, "No browser worker available")
     
     def close(self):
         """
         Close parser
         """
+        if self.playwright_worker:
+            self.http_manager.run(self.playwright_worker.close())
+            self.playwright_worker = None
+        
+        self.http_manager.close()
+        
+        with self.executor_lock:
+            if self.executor:
+                self.executor.shutdown()
+                self.manager.shutdown()
+                self.executor = None
+                self.manager = None
+        
+        close_pooled_drivers()
         logger.info("Parser closed successfully")
 
 
@@ -118,13 +415,13 @@ class OzonWorker:
     
     def initialize(self):
         """
-        Initialize worker with driver setup
+        Initialize worker with a pooled or freshly setup driver
         """
         try:
-            self.driver = self.selenium_manager.setup_driver()
+            self.driver = self.selenium_manager.acquire_driver()
             logger.info("Worker initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize worker: {e}")
+            logger.error("Failed to initialize worker: %s", e)
             raise
     
     def parse_articles(self, articles: List[int]) -> List[ArticleResult]:
@@ -145,130 +442,110 @@ class OzonWorker:
         """
         Parse single article with retries
         """
+        url = build_ozon_api_url(article)
+        logger.info("Built URL: %s", url)
+        
         for attempt in range(settings.MAX_RETRIES):
             try:
-                logger.info(f"Parsing article {article}, attempt {attempt + 1}")
-                
-                # Build URL
-                url = build_ozon_api_url(article)
-                logger.info(f"Built URL: {url}")
+                logger.info("Parsing article %s, attempt %s", article, attempt + 1)
                 
                 # Navigate to URL
                 navigation_success = self.selenium_manager.navigate_to_url(url)
-                logger.info(f"Navigation success: {navigation_success}")
+                logger.info("Navigation success: %s", navigation_success)
                 
                 if not navigation_success:
-                    logger.warning(f"Failed to navigate to URL for article {article}")
+                    logger.warning("Failed to navigate to URL for article %s", article)
                     
-                    # Попробуем получить дополнительную информацию для отладки
-                    if self.driver:
-                        current_url = self.driver.current_url
-                        page_title = self.driver.title
-                        logger.info(f"Current URL: {current_url}")
-                        logger.info(f"Page title: {page_title}")
-                        
-                        # Сохраним часть исходного кода для анализа
-                        page_source = self.driver.page_source[:1000]
-                        logger.debug(f"Page source sample: {page_source}")
+                    # Дополнительная информация для отладки (каждое чтение - запрос к драйверу)
+                    if self.driver and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Current URL: %s", self.driver.current_url)
+                        logger.debug("Page title: %s", self.driver.title)
+                        logger.debug("Page source sample: %s", self.driver.page_source[:1000])
                     
                     if attempt < settings.MAX_RETRIES - 1:
-                        logger.info(f"Retrying navigation in {settings.RETRY_DELAY} seconds...")
-                        time.sleep(settings.RETRY_DELAY)
+                        delay = get_retry_delay(attempt)
+                        logger.info("Retrying navigation in %.1f seconds...", delay)
+                        time.sleep(delay)
                         continue
                     else:
-                        return ArticleResult(
-                            article=article,
-                            success=False,
-                            error="Failed to navigate to URL"
-                        )
+                        return ArticleResult.fail(article, "Failed to navigate to URL")
                 
-                # Debug page content first
+                # Debug page content first (no-op unless DEBUG logging is enabled)
                 self.selenium_manager.debug_page_content()
                 
                 # Wait for JSON response
                 page_source = self.selenium_manager.wait_for_json_response()
                 
                 if not page_source:
-                    logger.warning(f"No JSON response for article {article}")
+                    logger.warning("No JSON response for article %s", article)
                     if attempt < settings.MAX_RETRIES - 1:
-                        logger.info(f"Retrying JSON wait in {settings.RETRY_DELAY} seconds...")
-                        time.sleep(settings.RETRY_DELAY)
+                        delay = get_retry_delay(attempt)
+                        logger.info("Retrying JSON wait in %.1f seconds...", delay)
+                        time.sleep(delay)
                         continue
                     else:
-                        return ArticleResult(
-                            article=article,
-                            success=False,
-                            error="No JSON response received"
-                        )
+                        return ArticleResult.fail(article, "No JSON response received")
                 
                 # Parse JSON response
                 price_info = self.extract_price_info(page_source)
                 
                 if price_info:
-                    logger.info(f"Successfully parsed article {article}")
-                    return ArticleResult(
-                        article=article,
-                        success=True,
-                        price_info=price_info
-                    )
+                    logger.info("Successfully parsed article %s", article)
+                    return ArticleResult.ok(article, price_info)
                 else:
-                    logger.warning(f"Failed to extract price info for article {article}")
+                    logger.warning("Failed to extract price info for article %s", article)
                     if attempt < settings.MAX_RETRIES - 1:
-                        logger.info(f"Retrying price extraction in {settings.RETRY_DELAY} seconds...")
-                        time.sleep(settings.RETRY_DELAY)
+                        delay = get_retry_delay(attempt)
+                        logger.info("Retrying price extraction in %.1f seconds...", delay)
+                        time.sleep(delay)
                         continue
                     else:
-                        return ArticleResult(
-                            article=article,
-                            success=False,
-                            error="Failed to extract price info"
-                        )
+                        return ArticleResult.fail(article, "Failed to extract price info")
                 
             except Exception as e:
-                logger.error(f"Error parsing article {article}: {e}")
+                logger.error("Error parsing article %s: %s", article, e)
                 if attempt < settings.MAX_RETRIES - 1:
-                    logger.info(f"Retrying after error in {settings.RETRY_DELAY} seconds...")
-                    time.sleep(settings.RETRY_DELAY)
+                    delay = get_retry_delay(attempt)
+                    logger.info("Retrying after error in %.1f seconds...", delay)
+                    time.sleep(delay)
                     continue
                 else:
-                    return ArticleResult(
-                        article=article,
-                        success=False,
-                        error=str(e)
-                    )
-        
-        return ArticleResult(
-            article=article,
-            success=False,
-            error="Max retries exceeded"
-        )
+                    return ArticleResult.fail(article, str(e))
+        
+        return ArticleResult.fail(article, "Max retries exceeded")
     
-    def extract_price_info(self, json_content: str) -> Optional[PriceInfo]:
+    @staticmethod
+    def extract_price_info(json_content: Union[str, bytes]) -> Optional[PriceInfo]:
         """
         Extract price information from JSON content
         """
         try:
             logger.info("Extracting price info from JSON content")
             
-            # Проверяем, что это валидный JSON
-            if not is_valid_json_response(json_content):
-                logger.warning("Invalid JSON content")
-                return None
-            
-            # Парсим JSON
-            data = json.loads(json_content)
+            if isinstance(json_content, str):
+                json_content = json_content.encode()
             
-            # Получаем widgetStates
-            widget_states = data.get('widgetStates', {})
-            
-            if not widget_states:
-                logger.warning("No widgetStates found in JSON")
-                return None
-            
-            logger.info(f"Found {len(widget_states)} widget states")
+            # Ищем нужные виджеты прямо в байтах, без разбора всего widgetStates
+            try:
+                web_price_value, title = scan_price_and_title(json_content)
+            except orjson.JSONDecodeError:
+                # Битый литерал - пусть решит полный разбор ниже
+                web_price_value, title = None, None
             
-            # Ищем webPrice свойство
-            web_price_value = find_web_price_property(widget_states)
+            if not web_price_value:
+                # Полный разбор (невалидный JSON вызовет JSONDecodeError)
+                data = orjson.loads(json_content)
+                
+                # Получаем widgetStates
+                widget_states = data.get('widgetStates', {})
+                
+                if not widget_states:
+                    logger.warning("No widgetStates found in JSON")
+                    return None
+                
+                logger.info("Found %s widget states", len(widget_states))
+                
+                web_price_value, title = find_price_and_title(widget_states.items())
             
             if not web_price_value:
                 logger.warning("No webPrice property found in widget states")
@@ -280,30 +557,101 @@ class OzonWorker:
             price_info = parse_price_data(web_price_value)
             
             if price_info:
-                # Ищем название товара
-                title = find_product_title(widget_states)
                 if title:
                     price_info.title = title
-                    logger.info(f"Found product title: {title[:50]}...")
+                    logger.info("Found product title: %s...", title[:50])
                 
-                logger.info(f"Successfully extracted price info: {price_info}")
+                logger.info("Successfully extracted price info: %s", price_info)
                 return price_info
             else:
                 logger.warning("Failed to parse price data from webPrice property")
                 return None
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.debug(f"JSON content preview: {json_content[:500]}")
+        except orjson.JSONDecodeError as e:
+            logger.error("JSON decode error: %s", e)
+            logger.debug("JSON content preview: %s", json_content[:500])
             return None
         except Exception as e:
-            logger.error(f"Error extracting price info: {e}")
+            logger.error("Error extracting price info: %s", e)
             return None
     
     def close(self):
         """
-        Close worker and cleanup resources
+        Close worker, returning its driver to the pool
         """
         if self.selenium_manager:
-            self.selenium_manager.close()
-        logger.info("Worker closed successfully")
\ No newline at end of file
+            self.selenium_manager.release_driver()
+        self.driver = None
+        logger.info("Worker closed successfully")
+
+
+class OzonPlaywrightWorker:
+    def __init__(self):
+        self.playwright_manager = PlaywrightManager()
+        self.semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def initialize(self):
+        """
+        Initialize worker with one browser for all articles
+        """
+        try:
+            await self.playwright_manager.setup_browser()
+            self.semaphore = asyncio.Semaphore(settings.MAX_WORKERS)
+            logger.info("Playwright worker initialized successfully")
+        except Exception as e:
+            logger.error("Failed to initialize Playwright worker: %s", e)
+            raise
+    
+    def is_alive(self) -> bool:
+        """
+        Check the browser is still connected
+        """
+        return self.playwright_manager.is_connected()
+    
+    async def parse_articles(self, articles: List[int]) -> List[ArticleResult]:
+        """
+        Parse articles concurrently, at most MAX_WORKERS pages at a time
+        """
+        if not self.semaphore:
+            raise RuntimeError("Worker not initialized")
+        
+        return await asyncio.gather(*[self.parse_single_article(article) for article in articles])
+    
+    async def parse_single_article(self, article: int) -> ArticleResult:
+        """
+        Parse single article with retries
+        """
+        url = build_ozon_api_url(article)
+        error = "Max retries exceeded"
+        
+        for attempt in range(settings.MAX_RETRIES):
+            try:
+                logger.info("Parsing article %s with Playwright, attempt %s", article, attempt + 1)
+                
+                async with self.semaphore:
+                    body = await self.playwright_manager.fetch_json(url)
+                
+                price_info = OzonWorker.extract_price_info(body) if body else None
+                
+                if price_info:
+                    logger.info("Successfully parsed article %s", article)
+                    return ArticleResult.ok(article, price_info)
+                
+                error = "Failed to extract price info"
+                logger.warning("Failed to extract price info for article %s", article)
+                
+            except Exception as e:
+                error = str(e)
+                logger.error("Error parsing article %s: %s", article, e)
+            
+            if attempt < settings.MAX_RETRIES - 1:
+                await asyncio.sleep(get_retry_delay(attempt))
+        
+        return ArticleResult.fail(article, error)
+    
+    async def close(self):
+        """
+        Close worker and cleanup resources
+        """
+        await self.playwright_manager.close()
+        logger.info("Playwright worker closed successfully")
\ No newline at end of file
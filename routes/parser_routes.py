@@ -1,6 +1,7 @@
 import logging
 import time
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from models.schemas import ArticlesRequest, ParseResponse, ArticleResult
 from parser.ozon_parser import OzonParser
 from typing import List
@@ -36,8 +37,8 @@ async def get_price(request: ArticlesRequest):
         # Get parser instance
         parser = get_parser()
         
-        # Parse articles
-        results = parser.parse_articles(request.articles)
+        # Parse articles (blocking, keep it off the event loop)
+        results = await run_in_threadpool(parser.parse_articles, request.articles)
         
         # Calculate timing
         end_time = time.time()
@@ -87,7 +88,7 @@ async def restart_parser():
     global parser_instance
     try:
         if parser_instance:
-            parser_instance.close()
+            await run_in_threadpool(parser_instance.close)
         parser_instance = None
         
         # Initialize new parser
@@ -15,6 +15,16 @@ def install_requirements():
         sys.exit(1)
 
 
+def install_playwright_browser():
+    """Install Chromium used by the Playwright fallback"""
+    try:
+        subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium"])
+        print("✓ Playwright Chromium installed successfully")
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Failed to install Playwright Chromium: {e}")
+        sys.exit(1)
+
+
 def check_chromedriver():
     """Check if ChromeDriver is available"""
     try:
@@ -54,6 +64,9 @@ if __name__ == "__main__":
     # Install requirements
     install_requirements()
     
+    # Install Playwright browser
+    install_playwright_browser()
+    
     # Check ChromeDriver
     check_chromedriver()
     
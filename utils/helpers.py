@@ -1,14 +1,37 @@
-import json
+import math
+import random
 import re
+import orjson
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Final, Iterable, List, Tuple
 from models.schemas import PriceInfo
+from config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+# Common anti-bot indicators
+BLOCKED_INDICATORS: Final[List[str]] = [
+    "cloudflare",
+    "checking your browser",
+    "enable javascript",
+    "access denied",
+    "blocked"
+]
 
-def extract_price_from_string(price_str: str) -> Optional[int]:
+# Start of the top-level widgetStates object
+WIDGET_STATES_PATTERN: Final = re.compile(rb'"widgetStates"\s*:\s*\{')
+
+# String literals (skipped whole) and braces, enough to find where an object ends
+JSON_BRACE_PATTERN: Final = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]')
+
+# Unescaped "webPrice-…"/"webProductHeading-…" keys with their JSON string values
+WIDGET_VALUE_PATTERN: Final = re.compile(
+    rb'(?<!\\)"((?:webPrice|webProductHeading)-[^"\\]*)"\s*:\s*("[^"\\]*(?:\\.[^"\\]*)*")'
+)
+
+
+def extract_price_from_string(price_str: Optional[str]) -> Optional[int]:
     """
     Extract numeric price from string like '55 325 ₽' or '61 472 ₽'
     """
@@ -21,7 +44,7 @@ def extract_price_from_string(price_str: str) -> Optional[int]:
     try:
         return int(cleaned) if cleaned else None
     except ValueError:
-        logger.warning(f"Failed to parse price: {price_str}")
+        logger.warning("Failed to parse price: %s", price_str)
         return None
 
 
@@ -30,42 +53,86 @@ def parse_price_data(price_json_str: str) -> Optional[PriceInfo]:
     Parse price data from JSON string
     """
     try:
-        price_data = json.loads(price_json_str)
+        price_data = orjson.loads(price_json_str)
         
-        return PriceInfo(
-            isAvailable=price_data.get('isAvailable', False),
+        return PriceInfo.model_construct(
+            isAvailable=bool(price_data.get('isAvailable', False)),
             cardPrice=extract_price_from_string(price_data.get('cardPrice')),
             price=extract_price_from_string(price_data.get('price')),
             originalPrice=extract_price_from_string(price_data.get('originalPrice'))
         )
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
-        logger.error(f"Failed to parse price data: {e}")
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        logger.error("Failed to parse price data: %s", e)
         return None
 
 
-def find_web_price_property(widget_states: Dict[str, Any]) -> Optional[str]:
+def find_price_and_title(widget_items: Iterable[Tuple[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
     """
-    Find webPrice property in widgetStates
+    Find webPrice property and product title in a single pass over widgetStates items
     """
-    for key, value in widget_states.items():
-        if key.startswith('webPrice-') and isinstance(value, str):
-            return value
-    return None
+    web_price_value: Optional[str] = None
+    title: Optional[str] = None
+    
+    for key, value in widget_items:
+        if not isinstance(value, str):
+            continue
+        
+        if web_price_value is None and key.startswith('webPrice-'):
+            web_price_value = value
+        elif title is None and key.startswith('webProductHeading-'):
+            try:
+                title = orjson.loads(value).get('title')
+            except (orjson.JSONDecodeError, AttributeError):
+                pass
+        
+        if web_price_value is not None and title is not None:
+            break
+    
+    return web_price_value, title
 
 
-def find_product_title(widget_states: Dict[str, Any]) -> Optional[str]:
+def scan_price_and_title(body: bytes) -> Tuple[Optional[str], Optional[str]]:
     """
-    Find product title in webProductHeading property
+    Find webPrice property and product title by scanning raw response bytes
     """
-    for key, value in widget_states.items():
-        if key.startswith('webProductHeading-') and isinstance(value, str):
-            try:
-                heading_data = json.loads(value)
-                return heading_data.get('title')
-            except (json.JSONDecodeError, KeyError):
-                continue
-    return None
+    # bytes.find is a fast C search, bail out before any regex work
+    if body.find(b'"webPrice-') == -1:
+        return None, None
+    
+    # Other objects (e.g. trackingPayloads) reuse the same widget keys, search widgetStates only
+    widget_states = WIDGET_STATES_PATTERN.search(body)
+    if not widget_states:
+        return None, None
+    
+    start = widget_states.end() - 1
+    end = find_object_end(body, start)
+    if end == -1:
+        return None, None
+    
+    widget_items = (
+        (match.group(1).decode(), orjson.loads(match.group(2)))
+        for match in WIDGET_VALUE_PATTERN.finditer(body, start, end)
+    )
+    return find_price_and_title(widget_items)
+
 
+def find_object_end(body: bytes, start: int) -> int:
+    """
+    Index right after the JSON object opening at start, -1 if it is not closed
+    """
+    depth = 0
+    
+    # widgetStates values are single string literals, so this visits only a few tokens per widget
+    for match in JSON_BRACE_PATTERN.finditer(body, start):
+        token = match.group()
+        if token == b'{':
+            depth += 1
+        elif token == b'}':
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    
+    return -1
 
 
 def build_ozon_api_url(article: int) -> str:
@@ -81,16 +148,48 @@ def build_ozon_api_url(article: int) -> str:
     # Build full URL
     url = f"{base_url}?url={params['url']}"
     
-    logger.info(f"Built URL for article {article}: {url}")
+    logger.debug("Built URL for article %s: %s", article, url)
     return url
 
 
-def is_valid_json_response(response_text: str) -> bool:
+def get_retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
     """
-    Check if response is valid JSON
+    Exponential backoff with jitter, honoring Retry-After seconds when given
     """
-    try:
-        json.loads(response_text)
-        return True
-    except json.JSONDecodeError:
-        return False
\ No newline at end of file
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = math.nan
+        
+        # NaN or infinite values fall back to exponential backoff, negatives clamp to zero
+        if math.isfinite(seconds):
+            return float(min(max(0.0, seconds), settings.RETRY_MAX_DELAY))
+    
+    delay: float = min(settings.RETRY_MAX_DELAY, settings.RETRY_DELAY * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.5)
+
+
+def build_ozon_api_headers() -> Dict[str, str]:
+    """
+    Build browser-like headers for direct Ozon API requests
+    """
+    return {
+        "User-Agent": settings.USER_AGENT,
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Referer": f"{settings.OZON_BASE_URL}/",
+    }
+
+
+def is_blocked_content(content: str) -> bool:
+    """
+    Check if page content looks like an anti-bot challenge
+    """
+    content = content.lower()
+    
+    for indicator in BLOCKED_INDICATORS:
+        if indicator in content:
+            return True
+    
+    return False